@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import argparse
+import os
 import re
+import struct
 import subprocess
 import sys
 from pathlib import Path
@@ -231,25 +233,34 @@ def main() -> int:
         print("error: no suitable sections selected", file=sys.stderr)
         return 2
 
-    data = elf.read_bytes()
+    # Only the selected sections are decoded, so don't load the whole ELF.
+    blobs = []
+    with elf.open("rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        for sec in selected:
+            off = sec["off"]
+            size = sec["size"]
+            if off + size > file_size:
+                print(
+                    f"error: section {sec['name']} extends beyond file size",
+                    file=sys.stderr,
+                )
+                return 2
+            f.seek(off)
+            blobs.append(f.read(size))
+
     renamed_rd = set()
     offenders = []
 
-    for sec in selected:
+    for sec, blob in zip(selected, blobs):
         sec_name = sec["name"]
         sec_addr = sec["addr"]
-        off = sec["off"]
-        size = sec["size"]
-        if off + size > len(data):
-            print(
-                f"error: section {sec['name']} extends beyond file size",
-                file=sys.stderr,
-            )
-            return 2
-        blob = data[off : off + size]
+        # Muon instructions are 64-bit. --sections and the PROGBITS fallback can
+        # pick a section whose size isn't a multiple of 8; a trailing partial word
+        # can't be an instruction, so drop it (iter_unpack rejects it otherwise).
         n_words = len(blob) // 8
-        for i in range(n_words):
-            inst = int.from_bytes(blob[i * 8 : (i + 1) * 8], byteorder="little", signed=False)
+        words = struct.iter_unpack("<Q", memoryview(blob)[: n_words * 8])
+        for i, (inst,) in enumerate(words):
             special = detect_nonzero_rd_special_custom0(inst)
             if special is not None:
                 opname, rd = special
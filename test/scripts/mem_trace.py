@@ -143,13 +143,13 @@ def print_table(rows):
         for i, cell in enumerate(r):
             widths[i] = max(widths[i], len(cell))
 
-    def line(cells):
-        return " | ".join(c.ljust(widths[i]) for i, c in enumerate(cells))
+    # Build the row template once instead of padding every cell individually.
+    row_fmt = " | ".join(f"{{:<{w}}}" for w in widths)
 
-    print(line(headers))
-    print("-+-".join("-" * w for w in widths))
-    for r in str_rows:
-        print(line(r))
+    # Emit the whole table in one write; dumps can run to many thousands of rows.
+    out = [row_fmt.format(*headers), "-+-".join("-" * w for w in widths)]
+    out.extend(row_fmt.format(*r) for r in str_rows)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def clipped_payload(row, start: int, end: int) -> bytes: